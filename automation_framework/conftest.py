@@ -1,11 +1,70 @@
 import pytest
 from playwright.sync_api import Playwright, Browser, BrowserContext, Page
+from fixtures.browser_matrix import BrowserMatrix
 from fixtures.browser_setup import BrowserSetup
 from fixtures.test_data import TestData
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 
 
+def pytest_addoption(parser):
+    """Register framework command line options."""
+    parser.addoption(
+        "--browsers",
+        action="store",
+        default=None,
+        help="Comma separated engines to run in one session, e.g. chromium,firefox,webkit"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Run one xdist worker group per engine when a browser matrix is requested."""
+    browsers = BrowserMatrix.parse(config.getoption("--browsers"))
+    if len(browsers) < 2 or not config.pluginmanager.hasplugin("xdist"):
+        return
+    if not config.getoption("numprocesses", None):
+        config.option.numprocesses = len(browsers)
+    if config.getoption("dist", "no") in ("no", "load"):
+        config.option.dist = "loadgroup"
+
+
+def pytest_configure(config):
+    """Configure the cross-browser matrix for the session."""
+    config.browser_matrix = BrowserMatrix(BrowserMatrix.parse(config.getoption("--browsers")))
+    config.pluginmanager.register(config.browser_matrix, "browser_matrix")
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize every test per requested browser engine."""
+    browsers = metafunc.config.browser_matrix.browsers
+    if browsers and "browser_name" in metafunc.fixturenames:
+        metafunc.parametrize("browser_name", browsers, scope="session")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Group matrix items per engine so each engine runs on its own worker."""
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        browser = callspec.params.get("browser_name") if callspec else None
+        if browser is None:
+            continue
+        item.add_marker(pytest.mark.xdist_group(name=browser))
+        item.user_properties.append(("browser", browser))
+        item.user_properties.append(("matrix_key", BrowserMatrix.matrix_key(item.nodeid, browser)))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Show per-browser results side by side."""
+    matrix = config.browser_matrix
+    if not matrix.browsers or hasattr(config, "workerinput") or config.option.collectonly:
+        return
+
+    terminalreporter.write_sep("=", "cross-browser matrix")
+    for line in matrix.summary_lines():
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"Matrix report: {matrix.write_report()}")
+
 @pytest.fixture(scope="session")
 def config():
     """Load configuration for the test session."""
@@ -25,12 +84,18 @@ def playwright_instance(config):
         yield p
 
 
+@pytest.fixture(scope="session", autouse=True)
+def browser_name(config):
+    """Browser engine under test, parametrized by --browsers."""
+    return config.get_browser_type()
+
+
 @pytest.fixture(scope="session")
-def browser(playwright_instance, config):
+def browser(playwright_instance, browser_name, config):
     """Setup browser instance for the session."""
     browser = BrowserSetup.launch_browser(
         playwright_instance,
-        browser_type=config.get_browser_type(),
+        browser_type=browser_name,
         headless=config.is_headless()
     )
     yield browser
@@ -0,0 +1,124 @@
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class BrowserMatrix:
+    """Cross-browser matrix execution inside a single pytest session."""
+
+    SUPPORTED_BROWSERS = ("chromium", "firefox", "webkit")
+
+    def __init__(self, browsers: List[str]):
+        self.browsers = browsers
+        self._totals: Dict[str, Dict[str, Any]] = {
+            name: {"passed": 0, "failed": 0, "skipped": 0, "duration": 0.0,
+                   "start": None, "stop": None}
+            for name in browsers
+        }
+        self._scenarios: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    @classmethod
+    def parse(cls, option_value: Optional[str]) -> List[str]:
+        """Parse a comma separated --browsers value into an ordered list."""
+        if not option_value:
+            return []
+
+        browsers = []
+        for name in option_value.split(","):
+            name = name.strip().lower()
+            if not name or name in browsers:
+                continue
+            if name not in cls.SUPPORTED_BROWSERS:
+                raise ValueError(f"Unsupported browser type: {name}")
+            browsers.append(name)
+        return browsers
+
+    @staticmethod
+    def matrix_key(nodeid: str, browser: str) -> str:
+        """Get the browser independent key of a parametrized test id."""
+        match = re.match(r"^(.*)\[(.*)\]$", nodeid)
+        if not match:
+            return nodeid
+
+        params = [param for param in match.group(2).split("-") if param != browser]
+        return f"{match.group(1)}[{'-'.join(params)}]" if params else match.group(1)
+
+    def pytest_runtest_logreport(self, report) -> None:
+        """Record a test report, including the ones sent back by xdist workers."""
+        properties = dict(report.user_properties)
+        browser = properties.get("browser")
+        if browser not in self._totals:
+            return
+
+        totals = self._totals[browser]
+        totals["duration"] += report.duration
+        start, stop = getattr(report, "start", None), getattr(report, "stop", None)
+        if start is not None:
+            totals["start"] = start if totals["start"] is None else min(totals["start"], start)
+        if stop is not None:
+            totals["stop"] = stop if totals["stop"] is None else max(totals["stop"], stop)
+
+        scenario = self._scenarios.setdefault(properties.get("matrix_key", report.nodeid), {})
+        result = scenario.setdefault(browser, {"outcome": "passed", "duration": 0.0})
+        result["duration"] += report.duration
+
+        if report.failed:
+            result["outcome"] = "failed"
+        elif report.skipped and result["outcome"] != "failed":
+            result["outcome"] = "skipped"
+
+        if report.when == "teardown":
+            totals[result["outcome"]] += 1
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get merged per-browser results."""
+        browsers = {}
+        for name, totals in self._totals.items():
+            wall = 0.0
+            if totals["start"] is not None and totals["stop"] is not None:
+                wall = totals["stop"] - totals["start"]
+            browsers[name] = {
+                "passed": totals["passed"],
+                "failed": totals["failed"],
+                "skipped": totals["skipped"],
+                "duration": round(totals["duration"], 3),
+                "wall_time": round(wall, 3)
+            }
+        return {"browsers": browsers, "scenarios": self._scenarios}
+
+    def summary_lines(self) -> List[str]:
+        """Render the per-browser results side by side."""
+        summary = self.get_summary()
+        key_width = max([len(key) for key in summary["scenarios"]] + [len("Test time (s)")])
+        header = "Scenario".ljust(key_width) + "".join(
+            f" | {name:>18}" for name in self.browsers
+        )
+        lines = [header, "-" * len(header)]
+
+        for key in sorted(summary["scenarios"]):
+            row = key.ljust(key_width)
+            for name in self.browsers:
+                result = summary["scenarios"][key].get(name)
+                cell = f"{result['outcome']} {result['duration']:.2f}s" if result else "-"
+                row += f" | {cell:>18}"
+            lines.append(row)
+
+        lines.append("-" * len(header))
+        for label, field in (("Passed", "passed"), ("Failed", "failed"), ("Skipped", "skipped")):
+            lines.append(label.ljust(key_width) + "".join(
+                f" | {summary['browsers'][name][field]:>18}" for name in self.browsers
+            ))
+        for label, field in (("Test time (s)", "duration"), ("Wall time (s)", "wall_time")):
+            lines.append(label.ljust(key_width) + "".join(
+                f" | {summary['browsers'][name][field]:>18.2f}" for name in self.browsers
+            ))
+        return lines
+
+    def write_report(self, path: str = "reports/browser_matrix.json") -> str:
+        """Write the merged matrix report to disk."""
+        report_path = Path(path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w") as file:
+            json.dump(self.get_summary(), file, indent=2)
+        return str(report_path)